@@ -10,58 +10,211 @@ Usage:
     python scraper.py interviewing.io
 """
 
+import asyncio
+import aiohttp
 import requests
-from bs4 import BeautifulSoup
-import trafilatura
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from trafilatura import bare_extraction
+from trafilatura.utils import normalize_unicode
+from trafilatura.xml import xmltotxt
+from lxml import etree, html as lxml_html
 import json
 import re
-from urllib.parse import urljoin, urlparse, urlunparse
+from urllib.robotparser import RobotFileParser
+from urllib.parse import ParseResult, urljoin, urlparse, urlunparse, parse_qsl, urlencode
+from collections import defaultdict
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
 from tqdm import tqdm
-import time
+import multiprocessing
+import os
 import sys
-from typing import List, Dict, Optional, Set
+import time
+from typing import AsyncIterator, BinaryIO, Collection, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 import logging
 
+try:
+    import brotli  # noqa: F401
+    HAS_BROTLI = True
+except ImportError:
+    HAS_BROTLI = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # Configure logging - only show warnings and errors
 logging.basicConfig(level=logging.WARNING, format='%(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Query parameters that never change page content (utm_* is handled separately)
+TRACKING_PARAMS = {'ref', 'fbclid'}
+
+# URL patterns for url_content_type, one named group per content type
+CONTENT_TYPE_RE = re.compile(
+    r'(?P<blog>/blog/|/post/|/article/|/guide/|/guides/|/tutorial/)'  # Guides count as blog content
+    r'|(?P<podcast_transcript>/podcast/|/episode/)'
+    r'|(?P<call_transcript>/call/|/meeting/)'
+    r'|(?P<linkedin_post>linkedin\.com|/posts/)'
+    r'|(?P<reddit_comment>reddit\.com|/comments/)'
+    r'|(?P<book>/book/|/books/)'
+)
+
+# Links to these are never fetched: they aren't articles and waste the page budget
+SKIPPED_EXTENSIONS = (
+    '.pdf', '.jpg', '.jpeg', '.png', '.gif', '.svg', '.zip', '.mp4', '.mp3',
+    '.css', '.js', '.ico', '.xml', '.rss'
+)
+SKIPPED_PATH_RE = re.compile(
+    r'/(?:wp-login|wp-admin|cdn-cgi|login|signup)(?:[/.]|$)'
+    r'|/tag/'
+    r'|/category/(?:[^/]+/)?page/\d+'
+)
+
+# Transient failures are retried this many times, with exponential backoff,
+# by both the aiohttp fetcher and the requests session
+MAX_RETRIES = 3
+RETRY_BACKOFF = 0.3
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Content types worth parsing; anything else is dropped before its body is read
+HTML_CONTENT_TYPES = ('text/html', 'application/xhtml+xml')
+
+# Title candidates in priority order: h1, title, .post-title, .entry-title, .article-title.
+# Precompiled, and tried one at a time so the class scans only run when needed.
+TITLE_XPATHS = [
+    etree.XPath('(//h1)[1]'),
+    etree.XPath('(//title)[1]'),
+] + [
+    etree.XPath(f"(//*[contains(concat(' ', normalize-space(@class), ' '), ' {cls} ')])[1]")
+    for cls in ('post-title', 'entry-title', 'article-title')
+]
+
+# Pages per ProcessPoolExecutor submission when parsing
+PARSE_BATCH_SIZE = 16
+
+# The pool starts while aiohttp's resolver and tqdm's monitor threads are alive,
+# and forking a process with live threads can deadlock, so never use fork
+PARSE_MP_CONTEXT = multiprocessing.get_context(
+    'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+)
+
+@lru_cache(maxsize=None)
+def _html_parser(encoding: Optional[str]) -> lxml_html.HTMLParser:
+    """Return a shared lxml HTML parser for the given encoding."""
+    try:
+        return lxml_html.HTMLParser(encoding=encoding)
+    except LookupError:
+        # Server sent a charset lxml doesn't know; let it detect one
+        return lxml_html.HTMLParser()
+
+def parse_html(html: bytes, encoding: Optional[str] = None) -> lxml_html.HtmlElement:
+    """
+    Parse raw HTML bytes into an lxml tree.
+    lxml detects the encoding from <meta> tags unless one is given.
+    """
+    return lxml_html.fromstring(html, parser=_html_parser(encoding))
+
+def parse_normalized_url(url: str) -> ParseResult:
+    """Parse a URL, defaulting the scheme to https, lowercasing the host and trimming trailing slashes."""
+    if not url.startswith(('http://', 'https://')):
+        url = 'https://' + url
+    
+    parsed = urlparse(url)
+    return parsed._replace(
+        netloc=parsed.netloc.lower(),
+        path=parsed.path.rstrip('/') or '/'
+    )
+
+@lru_cache(maxsize=50_000)
+def normalize_url(url: str) -> str:
+    """
+    Take a user input URL and return a normalized version.
+    Example: "quill.co/blog/" -> "https://quill.co/blog"
+    """
+    # Parse and reconstruct to normalize
+    return urlunparse(parse_normalized_url(url))
+
+@lru_cache(maxsize=50_000)
+def url_content_type(url: str) -> str:
+    """Detect content type from URL patterns alone."""
+    # Check URL patterns in a single scan; group names are the content types
+    match = CONTENT_TYPE_RE.search(url.lower())
+    if match:
+        return match.lastgroup
+    return "blog"  # Default to blog
+
+def detect_content_type(url: str, title: str, content: str) -> str:
+    """
+    Detect content type based on URL patterns and content.
+    Only the URL is used today, so results are cached on it alone rather than
+    on the (large, unique) page content.
+    """
+    return url_content_type(url)
+
 class WebScraper:
-    def __init__(self, max_pages: int = 50, delay: float = 0.5):
+    # Defined at module level so their LRU caches are shared by every scraper
+    # instance and the functions can be used from parse worker processes
+    normalize_url = staticmethod(normalize_url)
+    detect_content_type = staticmethod(detect_content_type)
+
+    def __init__(self, max_pages: int = 50, delay: float = 0.5, concurrency: int = 5,
+                 crawl_workers: int = 8):
         self.max_pages = max_pages
         self.delay = delay
+        self.concurrency = concurrency  # Max in-flight requests per host
+        self.crawl_workers = crawl_workers
         self.session = requests.Session()
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+            # Only advertise br when we can decode it
+            'Accept-Encoding': 'gzip, deflate, br' if HAS_BROTLI else 'gzip, deflate',
+            'Connection': 'keep-alive'
         })
+        
+        # Larger keep-alive pool with retries on transient errors
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=64,
+            max_retries=Retry(total=MAX_RETRIES, backoff_factor=RETRY_BACKOFF,
+                              status_forcelist=RETRY_STATUSES)
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.visited_urls: Set[str] = set()
         
-    def normalize_url(self, url: str) -> str:
+        # Per-host politeness state, see _wait_for_host
+        self._crawl_delays: Dict[str, float] = {}
+        self._last_fetch: Dict[str, float] = {}
+        
+    @staticmethod
+    @lru_cache(maxsize=100_000)
+    def _canonicalize(url: str) -> ParseResult:
         """
-        Take a user input URL and return a normalized version.
-        Example: "quill.co/blog/" -> "https://quill.co/blog"
+        Normalize a URL and return the parsed form used for deduplication.
+        Drops the fragment and tracking parameters and sorts the query.
+        Example: "a.co/p/?b=2&utm_source=x&a=1#top" -> "https://a.co/p?a=1&b=2"
+        Returned parsed so callers can check it without calling urlparse again.
         """
-        if not url.startswith(('http://', 'https://')):
-            url = 'https://' + url
-        
-        # Parse and reconstruct to normalize
-        parsed = urlparse(url)
-        normalized = urlunparse((
-            parsed.scheme,
-            parsed.netloc.lower(),
-            parsed.path.rstrip('/') or '/',
-            parsed.params,
-            parsed.query,
-            parsed.fragment
+        parsed = parse_normalized_url(url)
+        query = urlencode(sorted(
+            (key, value) for key, value in parse_qsl(parsed.query, keep_blank_values=True)
+            if not key.startswith('utm_') and key not in TRACKING_PARAMS
         ))
-        
-        return normalized
+        return parsed._replace(query=query, fragment='')
 
-    def is_valid_url(self, url: str, base_domain: str) -> bool:
-        """Check if URL is valid and internal to the base domain."""
+    def is_valid_url(self, parsed: ParseResult, base_domain: str) -> bool:
+        """Check if an already-parsed URL is a crawlable page internal to the base domain."""
         try:
-            parsed = urlparse(url)
-            if not parsed.netloc:
+            if parsed.scheme not in ('http', 'https') or not parsed.netloc:
+                return False
+            
+            # Skip binaries, assets and admin/listing pages before they are queued
+            path = parsed.path.lower()
+            if path.endswith(SKIPPED_EXTENSIONS) or SKIPPED_PATH_RE.search(path):
                 return False
             
             # Check if it's the same domain or subdomain
@@ -70,90 +223,122 @@ class WebScraper:
         except:
             return False
 
-    def extract_links(self, html: str, base_url: str, base_domain: str) -> List[str]:
-        """Extract internal links from HTML content."""
-        soup = BeautifulSoup(html, 'html.parser')
-        links = []
+    def extract_links(self, html: bytes, base_url: str, base_domain: str,
+                      encoding: Optional[str] = None, limit: Optional[int] = None,
+                      known: Collection[str] = ()) -> List[str]:
+        """
+        Extract internal links from raw HTML bytes.
+        Stops once `limit` links not already in `known` have been found.
+        """
+        try:
+            tree = parse_html(html, encoding)
+        except etree.ParserError:
+            # Empty or unparseable document
+            return []
         
-        for link in soup.find_all('a', href=True):
-            href = link['href']
+        links = set()
+        for href in tree.xpath('//a/@href'):
             full_url = urljoin(base_url, href)
             
-            # Clean up the URL
-            full_url = self.normalize_url(full_url)
+            # Reject mailto:, tel:, javascript: etc. before normalizing would prefix https://
+            if full_url.split(':', 1)[0].lower() not in ('http', 'https'):
+                continue
+            
+            # Clean up the URL so near-duplicates collapse to one entry
+            parsed = self._canonicalize(full_url)
             
-            if self.is_valid_url(full_url, base_domain):
-                links.append(full_url)
+            if self.is_valid_url(parsed, base_domain):
+                link = parsed.geturl()
+                if link not in known:
+                    links.add(link)
+                    if limit is not None and len(links) >= limit:
+                        break
         
-        return list(set(links))  # Remove duplicates
+        return list(links)
 
     def crawl_site(self, root_url: str) -> List[str]:
         """
         Starting from root_url, crawl for internal links.
         Returns: list of URLs to scrape
         """
-        root_url = self.normalize_url(root_url)
-        base_domain = urlparse(root_url).netloc
+        async def run() -> List[str]:
+            async with self._open_session() as session:
+                return await self._crawl(session, root_url)
+        
+        return asyncio.run(run())
+
+    async def _crawl(self, session: aiohttp.ClientSession, root_url: str,
+                     pages: Optional[Dict[str, Tuple[bytes, Optional[str]]]] = None) -> List[str]:
+        """
+        Crawl the site with a pool of workers sharing one URL queue.
+        If pages is given, the (html, encoding) of every page fetched is stored
+        in it so extraction can reuse them instead of downloading them again.
+        """
+        root = self._canonicalize(root_url)
+        root_url = root.geturl()
+        base_domain = root.netloc
         
-        urls_to_visit = [root_url]
+        urls_to_visit: asyncio.Queue = asyncio.Queue()
+        urls_to_visit.put_nowait(root_url)
         found_urls = set([root_url])
+        # Everything ever queued, including non-HTML URLs dropped from found_urls,
+        # so a link seen on many pages is only fetched once
+        seen_urls = set(found_urls)
         
         logger.info(f"Starting crawl from {root_url}")
         
-        while urls_to_visit and len(found_urls) < self.max_pages:
-            current_url = urls_to_visit.pop(0)
-            
-            if current_url in self.visited_urls:
-                continue
-                
-            try:
-                logger.info(f"Crawling: {current_url}")
-                response = self.session.get(current_url, timeout=10)
-                response.raise_for_status()
-                
-                self.visited_urls.add(current_url)
-                
-                # Extract links from this page
-                new_links = self.extract_links(response.text, current_url, base_domain)
-                
-                for link in new_links:
-                    if link not in found_urls and len(found_urls) < self.max_pages:
-                        found_urls.add(link)
-                        urls_to_visit.append(link)
-                
-                # Be respectful to the server
-                time.sleep(self.delay)
-                
-            except Exception as e:
-                logger.warning(f"Failed to crawl {current_url}: {e}")
-                continue
+        async def worker() -> None:
+            while True:
+                current_url = await urls_to_visit.get()
+                try:
+                    # Drain the queue without fetching once the budget is spent
+                    if current_url in self.visited_urls or len(found_urls) >= self.max_pages:
+                        continue
+                    
+                    logger.info(f"Crawling: {current_url}")
+                    page = await self._fetch(session, current_url)
+                    
+                    self.visited_urls.add(current_url)
+                    
+                    if page is None:
+                        # Not worth extracting either; free its slot in the budget.
+                        # It stays in seen_urls so other pages can't re-add it.
+                        found_urls.discard(current_url)
+                        continue
+                    
+                    html, encoding = page
+                    if pages is not None:
+                        pages[current_url] = page
+                    
+                    # Extract only as many new links as the budget has room for
+                    new_links = self.extract_links(
+                        html, current_url, base_domain, encoding,
+                        limit=self.max_pages - len(found_urls), known=seen_urls
+                    )
+                    
+                    # Safe without a lock: nothing awaits between check and add
+                    for link in new_links:
+                        if len(found_urls) >= self.max_pages:
+                            break
+                        if link not in seen_urls:
+                            seen_urls.add(link)
+                            found_urls.add(link)
+                            urls_to_visit.put_nowait(link)
+                    
+                except Exception as e:
+                    logger.warning(f"Failed to crawl {current_url}: {e}")
+                finally:
+                    urls_to_visit.task_done()
+        
+        workers = [asyncio.create_task(worker()) for _ in range(self.crawl_workers)]
+        await urls_to_visit.join()
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
         
         logger.info(f"Found {len(found_urls)} URLs to scrape")
         return list(found_urls)
 
-    def detect_content_type(self, url: str, title: str, content: str) -> str:
-        """Detect content type based on URL patterns and content."""
-        url_lower = url.lower()
-        title_lower = title.lower() if title else ""
-        
-        # Check URL patterns
-        if any(pattern in url_lower for pattern in ['/blog/', '/post/', '/article/']):
-            return "blog"
-        elif any(pattern in url_lower for pattern in ['/podcast/', '/episode/']):
-            return "podcast_transcript"
-        elif any(pattern in url_lower for pattern in ['/call/', '/meeting/']):
-            return "call_transcript"
-        elif any(pattern in url_lower for pattern in ['linkedin.com', '/posts/']):
-            return "linkedin_post"
-        elif any(pattern in url_lower for pattern in ['reddit.com', '/comments/']):
-            return "reddit_comment"
-        elif any(pattern in url_lower for pattern in ['/book/', '/books/']):
-            return "book"
-        elif any(pattern in url_lower for pattern in ['/guide/', '/guides/', '/tutorial/']):
-            return "blog"  # Treat guides as blog content
-        else:
-            return "blog"  # Default to blog
-
     def extract_content(self, url: str) -> Optional[Dict]:
         """
         Extract clean article content from a URL.
@@ -163,57 +348,151 @@ class WebScraper:
             logger.info(f"Extracting content from: {url}")
             response = self.session.get(url, timeout=15)
             response.raise_for_status()
+            # Only trust the header charset if the server actually sent one
+            content_type = response.headers.get('Content-Type', '').lower()
+            encoding = response.encoding if 'charset=' in content_type else None
+            return _parse(url, response.content, encoding)
             
-            # Use trafilatura for content extraction
-            extracted = trafilatura.extract(
-                response.text,
-                include_comments=False,
-                include_tables=True,
-                include_images=False,
-                include_links=True,
-                output_format='markdown'
-            )
-            
-            if not extracted:
-                logger.warning(f"No content extracted from {url}")
-                return None
-            
-            # Extract title using BeautifulSoup as fallback
-            soup = BeautifulSoup(response.text, 'html.parser')
-            title = None
-            
-            # Try multiple title extraction methods
-            for selector in ['h1', 'title', '.post-title', '.entry-title', '.article-title']:
-                title_elem = soup.select_one(selector)
-                if title_elem:
-                    title = title_elem.get_text().strip()
-                    break
-            
-            # If no title found, try to extract from markdown
-            if not title and extracted:
-                lines = extracted.split('\n')
-                for line in lines:
-                    if line.startswith('# '):
-                        title = line[2:].strip()
-                        break
-            
-            # Fallback to URL-based title
-            if not title:
-                title = urlparse(url).path.split('/')[-1].replace('-', ' ').replace('_', ' ').title()
-            
-            content_type = self.detect_content_type(url, title, extracted)
+        except Exception as e:
+            logger.warning(f"Failed to extract content from {url}: {e}")
+            return None
+
+    def _open_session(self) -> aiohttp.ClientSession:
+        """Create an aiohttp session for one event loop run."""
+        # Semaphores and locks bind to the loop they are first used on, so start fresh
+        self._host_semaphores = defaultdict(lambda: asyncio.Semaphore(self.concurrency))
+        self._host_locks = defaultdict(asyncio.Lock)
+        connector = aiohttp.TCPConnector(limit_per_host=self.concurrency, keepalive_timeout=30)
+        return aiohttp.ClientSession(
+            connector=connector,
+            headers=dict(self.session.headers),
+            timeout=aiohttp.ClientTimeout(total=15)
+        )
+
+    async def _get_crawl_delay(self, session: aiohttp.ClientSession, scheme: str, netloc: str) -> float:
+        """
+        Return the minimum spacing between requests to a host: our own delay,
+        raised to the robots.txt Crawl-delay if that is larger. Cached per host.
+        """
+        if netloc not in self._crawl_delays:
+            robots_delay = None
+            try:
+                async with session.get(f"{scheme}://{netloc}/robots.txt") as response:
+                    if response.status == 200:
+                        robots = RobotFileParser()
+                        robots.parse((await response.text()).splitlines())
+                        robots_delay = robots.crawl_delay(self.session.headers['User-Agent'])
+            except Exception as e:
+                logger.info(f"Could not read robots.txt for {netloc}: {e}")
             
-            return {
-                "title": title,
-                "content": extracted,
-                "content_type": content_type,
-                "source_url": url
-            }
+            self._crawl_delays[netloc] = max(self.delay, float(robots_delay or 0))
+        
+        return self._crawl_delays[netloc]
+
+    async def _wait_for_host(self, session: aiohttp.ClientSession, parsed: ParseResult) -> None:
+        """Wait until the next request to this URL's host is allowed."""
+        # Hosts are rate limited independently of each other
+        async with self._host_locks[parsed.netloc]:
+            delay = await self._get_crawl_delay(session, parsed.scheme, parsed.netloc)
+            wait = self._last_fetch.get(parsed.netloc, 0.0) + delay - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._last_fetch[parsed.netloc] = time.monotonic()
+
+    async def _fetch(self, session: aiohttp.ClientSession, url: str) -> Optional[Tuple[bytes, Optional[str]]]:
+        """
+        Download a page, rate limited and with bounded concurrency per host.
+        Returns the undecoded body and the charset from Content-Type, if any,
+        or None if the response is not HTML.
+        """
+        parsed = urlparse(url)
+        async with self._host_semaphores[parsed.netloc]:
+            for attempt in range(MAX_RETRIES + 1):
+                # Be respectful to the server
+                await self._wait_for_host(session, parsed)
+                
+                try:
+                    async with session.get(url) as response:
+                        if response.status in RETRY_STATUSES and attempt < MAX_RETRIES:
+                            retry_reason = f"HTTP {response.status}"
+                        else:
+                            response.raise_for_status()
+                            
+                            # Headers arrive before the body, so skip PDFs, images etc. without downloading them
+                            if 'Content-Type' in response.headers and response.content_type not in HTML_CONTENT_TYPES:
+                                logger.info(f"Skipping non-HTML {response.content_type} at {url}")
+                                return None
+                            
+                            return await response.read(), response.charset
+                except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                    if attempt == MAX_RETRIES:
+                        raise
+                    retry_reason = repr(e)
+                
+                # Back off like urllib3's Retry: RETRY_BACKOFF * 2^attempt
+                backoff = RETRY_BACKOFF * 2 ** attempt
+                logger.info(f"Retrying {url} in {backoff:.1f}s after {retry_reason}")
+                await asyncio.sleep(backoff)
+
+    async def _download(self, session: aiohttp.ClientSession, url: str,
+                        page: Optional[Tuple[bytes, Optional[str]]] = None) -> Optional[Tuple[str, bytes, Optional[str]]]:
+        """
+        Download a page for extraction, unless the crawl already fetched it.
+        Returns (url, html, encoding), or None on failure.
+        """
+        try:
+            logger.info(f"Extracting content from: {url}")
+            if page is None:
+                page = await self._fetch(session, url)
+                if page is None:
+                    return None
             
+            html, encoding = page
+            return url, html, encoding
         except Exception as e:
             logger.warning(f"Failed to extract content from {url}: {e}")
             return None
 
+    async def _extract_all(self, session: aiohttp.ClientSession, urls: List[str],
+                           pages: Optional[Dict[str, Tuple[bytes, Optional[str]]]] = None) -> AsyncIterator[Dict]:
+        """
+        Download pages concurrently and parse them in worker processes.
+        Pages are handed to the pool in batches so parsing overlaps downloading,
+        and items are yielded as soon as their batch is parsed.
+        """
+        loop = asyncio.get_running_loop()
+        batch = []
+        parsing = set()
+        
+        with ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=PARSE_MP_CONTEXT) as executor:
+            # Pages the crawl already fetched are handed over instead of re-downloaded
+            pages = pages if pages is not None else {}
+            downloads = [self._download(session, url, pages.pop(url, None)) for url in urls]
+            for download in tqdm(asyncio.as_completed(downloads), total=len(downloads), desc="Extracting content"):
+                page = await download
+                if page is None:
+                    continue
+                
+                batch.append(page)
+                if len(batch) >= PARSE_BATCH_SIZE:
+                    parsing.add(loop.run_in_executor(executor, _parse_batch, batch))
+                    batch = []
+                
+                # Hand back batches that finished while we were downloading
+                for future in [future for future in parsing if future.done()]:
+                    parsing.remove(future)
+                    for content_data in future.result():
+                        if content_data:
+                            yield content_data
+            
+            if batch:
+                parsing.add(loop.run_in_executor(executor, _parse_batch, batch))
+            
+            for future in asyncio.as_completed(parsing):
+                for content_data in await future:
+                    if content_data:
+                        yield content_data
+
     def build_output(self, site_url: str, items: List[Dict]) -> Dict:
         """Build the final JSON output."""
         return {
@@ -221,20 +500,41 @@ class WebScraper:
             "items": items
         }
 
-    def scrape_site(self, url: str) -> Dict:
-        """Main method to scrape a site and return JSON output."""
+    def scrape_items(self, url: str) -> Iterator[Dict]:
+        """
+        Scrape a site, yielding items one at a time as they are extracted.
+        Use this instead of scrape_site to avoid holding every item in memory.
+        """
         normalized_url = self.normalize_url(url)
         
-        # Step 1: Crawl for URLs
-        urls = self.crawl_site(normalized_url)
+        async def run() -> AsyncIterator[Dict]:
+            # Share one connection pool between crawling and extraction
+            async with self._open_session() as session:
+                # Step 1: Crawl for URLs, keeping the pages fetched along the way
+                pages = {}
+                urls = await self._crawl(session, normalized_url, pages)
+                
+                # Step 2: Extract content from each URL
+                async for content_data in self._extract_all(session, urls, pages):
+                    yield content_data
         
-        # Step 2: Extract content from each URL
-        items = []
-        for url_to_scrape in tqdm(urls, desc="Extracting content"):
-            content_data = self.extract_content(url_to_scrape)
-            if content_data:
-                items.append(content_data)
-            time.sleep(self.delay)  # Be respectful
+        # Drive the async generator from a private loop so callers stay synchronous
+        items = run()
+        loop = asyncio.new_event_loop()
+        try:
+            while True:
+                try:
+                    yield loop.run_until_complete(items.__anext__())
+                except StopAsyncIteration:
+                    break
+        finally:
+            loop.run_until_complete(items.aclose())
+            loop.close()
+
+    def scrape_site(self, url: str) -> Dict:
+        """Main method to scrape a site and return JSON output."""
+        normalized_url = self.normalize_url(url)
+        items = list(self.scrape_items(normalized_url))
         
         # Step 3: Build output
         output = self.build_output(normalized_url, items)
@@ -242,6 +542,100 @@ class WebScraper:
         logger.info(f"Successfully scraped {len(items)} items from {normalized_url}")
         return output
 
+def _parse(url: str, html: bytes, encoding: Optional[str] = None) -> Optional[Dict]:
+    """
+    Extract title and markdown content from a downloaded page.
+    Module-level so it can run in a ProcessPoolExecutor worker.
+    """
+    # Parse once and share the tree between title lookup and trafilatura
+    try:
+        tree = parse_html(html, encoding)
+    except etree.ParserError:
+        logger.warning(f"No content extracted from {url}")
+        return None
+    
+    # Look up the title first, since trafilatura may prune the tree
+    title = None
+    for title_xpath in TITLE_XPATHS:
+        title_elems = title_xpath(tree)
+        if title_elems:
+            title = title_elems[0].text_content().strip()
+            break
+    
+    # Use trafilatura for content extraction on the already-parsed tree,
+    # then render its body to markdown as extract(output_format='markdown') would
+    document = bare_extraction(
+        tree,
+        url=url,
+        include_comments=False,
+        include_tables=True,
+        include_images=False,
+        include_links=True,
+        include_formatting=True,
+        with_metadata=False,
+        output_format='markdown'
+    )
+    extracted = normalize_unicode(xmltotxt(document.body, include_formatting=True).strip()) if document else None
+    
+    if not extracted:
+        logger.warning(f"No content extracted from {url}")
+        return None
+    
+    # If no title found, try to extract from markdown
+    if not title and extracted:
+        lines = extracted.split('\n')
+        for line in lines:
+            if line.startswith('# '):
+                title = line[2:].strip()
+                break
+    
+    # Fallback to URL-based title
+    if not title:
+        title = urlparse(url).path.split('/')[-1].replace('-', ' ').replace('_', ' ').title()
+    
+    content_type = detect_content_type(url, title, extracted)
+    
+    return {
+        "title": title,
+        "content": extracted,
+        "content_type": content_type,
+        "source_url": url
+    }
+
+def _parse_batch(batch: List[Tuple[str, bytes, Optional[str]]]) -> List[Optional[Dict]]:
+    """Parse a batch of (url, html, encoding) pages in one worker call to amortize IPC."""
+    results = []
+    for url, html, encoding in batch:
+        try:
+            results.append(_parse(url, html, encoding))
+        except Exception as e:
+            logger.warning(f"Failed to extract content from {url}: {e}")
+            results.append(None)
+    return results
+
+def dumps_json(obj) -> bytes:
+    """Serialize obj as 2-space indented UTF-8 JSON, using orjson when it is installed."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+def write_output(f: BinaryIO, site_url: str, items: Iterable[Dict]) -> int:
+    """
+    Write the output JSON to a binary file one item at a time, so memory use
+    doesn't grow with the number of pages. Produces the same document as
+    dumps_json(build_output(...)). Returns the number of items written.
+    """
+    f.write(b'{\n  "site": ' + dumps_json(site_url) + b',\n  "items": [')
+    
+    total_items = 0
+    for item in items:
+        item_json = dumps_json(item).replace(b'\n', b'\n    ')
+        f.write((b',' if total_items else b'') + b'\n    ' + item_json)
+        total_items += 1
+    
+    f.write(b'\n  ]\n}' if total_items else b']\n}')
+    return total_items
+
 def test_coverage(urls: List[str]) -> None:
     """Test coverage on multiple sites."""
     scraper = WebScraper(max_pages=20)  # Smaller limit for testing
@@ -290,13 +684,18 @@ def main():
         print(f"📄 Output will be saved to: {output_file}")
         print("⏳ This may take a few minutes...")
         
-        result = scraper.scrape_site(url)
-        
-        # Save to file
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(result, f, indent=2, ensure_ascii=False)
+        # Stream items to a temp file as they are extracted, and only replace
+        # the output once scraping succeeds so a failure never leaves it truncated
+        tmp_file = output_file + '.tmp'
+        try:
+            with open(tmp_file, 'wb') as f:
+                total_items = write_output(f, scraper.normalize_url(url), scraper.scrape_items(url))
+            os.replace(tmp_file, output_file)
+        finally:
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
         
-        print(f"✅ Successfully scraped {len(result['items'])} items")
+        print(f"✅ Successfully scraped {total_items} items")
         print(f"📁 Results saved to: {output_file}")
         
     except Exception as e:
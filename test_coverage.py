@@ -12,7 +12,7 @@ import json
 from datetime import datetime
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from scraper import WebScraper
+from scraper import WebScraper, dumps_json
 
 # Test sites from the challenge + additional test blogs
 TEST_SITES = [
@@ -65,8 +65,8 @@ def test_coverage_with_files(urls):
             domain = url.replace('https://', '').replace('http://', '').replace('/', '_').replace('.', '_')
             filename = f"{output_dir}/{domain}_result.json"
             
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(result, f, indent=2, ensure_ascii=False)
+            with open(filename, 'wb') as f:
+                f.write(dumps_json(result))
             
             # Record summary
             test_result = {